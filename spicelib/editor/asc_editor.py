@@ -17,14 +17,15 @@
 # Licence:     refer to the LICENSE file
 # -------------------------------------------------------------------------------
 import os.path
+import sys
 from pathlib import Path
-from typing import Union, Optional, Tuple, List
+from typing import Union, Optional, Tuple, List, Iterator
 from ..utils.detect_encoding import detect_encoding, EncodingDetectError
 import re
 import logging
 
-from .ltspice_utils import TEXT_REGEX, TEXT_REGEX_X, TEXT_REGEX_Y, TEXT_REGEX_ALIGN, TEXT_REGEX_SIZE, TEXT_REGEX_TYPE, \
-    TEXT_REGEX_TEXT, END_LINE_TERM, ASC_ROTATION_DICT, ASC_INV_ROTATION_DICT, asc_text_align_set, asc_text_align_get
+from .ltspice_utils import END_LINE_TERM, ASC_ROTATION_DICT, ASC_TEXT_ALIGNMENTS, asc_rotation_name, \
+    asc_text_align_set, asc_text_align_get
 from .spice_editor import SpiceEditor, SpiceCircuit
 from ..simulators.ltspice_simulator import LTspice
 from ..utils.file_search import search_file_in_containers
@@ -41,6 +42,7 @@ _logger = logging.getLogger("spicelib.AscEditor")
 LTSPICE_PARAMETERS = ("Value", "Value2", "SpiceModel", "SpiceLine", "SpiceLine2")
 LTSPICE_PARAMETERS_REDUCED = ("SpiceLine", "SpiceLine2")
 LTSPICE_ATTRIBUTES = ("InstName", "Def_Sub")
+param_regex = re.compile(PARAM_REGEX(r"\w+"), re.IGNORECASE)  # Matches any parameter assignment
 
 
 class AscEditor(BaseSchematic):
@@ -59,7 +61,7 @@ class AscEditor(BaseSchematic):
     def __init__(self, asc_file: Union[str, Path], encoding='autodetect'):
         super().__init__()
         self.version = 4
-        self.sheet = "1 0 0"  # Three values are present on the SHEET clause
+        self.sheet: Tuple[int, int, int] = (1, 0, 0)  # Sheet number, width and height, as in the SHEET clause
         self.asc_file_path = Path(asc_file)
         if not self.asc_file_path.exists():
             raise FileNotFoundError(f"File {asc_file} not found")
@@ -82,181 +84,233 @@ class AscEditor(BaseSchematic):
         if isinstance(run_netlist_file, str):
             run_netlist_file = Path(run_netlist_file)
         run_netlist_file = run_netlist_file.with_suffix(".asc")
+        # The file contents are accumulated in a list and written at once at the end
+        asc_lines = [
+            f"Version {self.version}",
+            f"SHEET {self.sheet[0]} {self.sheet[1]} {self.sheet[2]}",
+        ]
+        for wire in self.wires:
+            asc_lines.append(f"WIRE {wire.V1.X} {wire.V1.Y} {wire.V2.X} {wire.V2.Y}")
+        for flag in self.labels:
+            asc_lines.append(f"FLAG {flag.coord.X} {flag.coord.Y} {flag.text}")
+        for component in self.components.values():
+            symbol = component.symbol
+            posX = component.position.X
+            posY = component.position.Y
+            rotation = asc_rotation_name(component.rotation)
+            asc_lines.append(f"SYMBOL {symbol} {posX} {posY} {rotation}")
+            for attr, value in component.attributes.items():
+                if attr.startswith('_WINDOW') and isinstance(value, Text):
+                    num_ref = attr[len("_WINDOW_"):]
+                    posX = value.coord.X
+                    posY = value.coord.Y
+                    alignment = asc_text_align_get(value)
+                    size = value.size
+                    asc_lines.append(f"WINDOW {num_ref} {posX} {posY} {alignment} {size}")
+            asc_lines.append(f"SYMATTR InstName {component.reference}")
+            if component.reference.startswith('X') and "_SUBCKT" in component.attributes:
+                # writing the sub-circuit if it was updated
+                sub_circuit: AscEditor = component.attributes['_SUBCKT']
+                if sub_circuit is not None and sub_circuit.updated:
+                    sub_circuit.save_netlist(sub_circuit.asc_file_path)
+            for attr, value in component.attributes.items():
+                if not attr.startswith('_'):  # All these are not exported since they are only used internally
+                    asc_lines.append(f"SYMATTR {attr} {value}")
+        for directive in self.directives:
+            posX = directive.coord.X
+            posY = directive.coord.Y
+            alignment = asc_text_align_get(directive)
+            size = directive.size
+            if directive.type == TextTypeEnum.DIRECTIVE:
+                directive_type = '!'
+            else:
+                directive_type = ';'  # Otherwise assume it is a comment
+            asc_lines.append(f"TEXT {posX} {posY} {alignment} {size} {directive_type}{directive.text}")
+        for line in self.lines:
+            line_style = f' {line.style.pattern}' if line.style.pattern != "" else ""
+            asc_lines.append(f"LINE Normal {line.V1.X} {line.V1.Y} {line.V2.X} {line.V2.Y}{line_style}")
+        for shape in self.shapes:
+            line_style = f' {shape.line_style.pattern}' if shape.line_style.pattern != "" else ""
+            points = " ".join([f"{point.X} {point.Y}" for point in shape.points])
+            asc_lines.append(f"{shape.name} Normal {points}{line_style}")
+        asc_lines.append("")  # So that the file is terminated by an END_LINE_TERM
+
         with open(run_netlist_file, 'w', encoding=self.encoding) as asc:
             _logger.info(f"Writing ASC file {run_netlist_file}")
-
-            asc.write(f"Version {self.version}" + END_LINE_TERM)
-            asc.write(f"SHEET {self.sheet}" + END_LINE_TERM)
-            for wire in self.wires:
-                asc.write(f"WIRE {wire.V1.X} {wire.V1.Y} {wire.V2.X} {wire.V2.Y}" + END_LINE_TERM)
-            for flag in self.labels:
-                asc.write(f"FLAG {flag.coord.X} {flag.coord.Y} {flag.text}" + END_LINE_TERM)
-            for component in self.components.values():
-                symbol = component.symbol
-                posX = component.position.X
-                posY = component.position.Y
-                rotation = ASC_INV_ROTATION_DICT[component.rotation]
-                asc.write(f"SYMBOL {symbol} {posX} {posY} {rotation}" + END_LINE_TERM)
-                for attr, value in component.attributes.items():
-                    if attr.startswith('_WINDOW') and isinstance(value, Text):
-                        num_ref = attr[len("_WINDOW_"):]
-                        posX = value.coord.X
-                        posY = value.coord.Y
-                        alignment = asc_text_align_get(value)
-                        size = value.size
-                        asc.write(f"WINDOW {num_ref} {posX} {posY} {alignment} {size}" + END_LINE_TERM)
-                asc.write(f"SYMATTR InstName {component.reference}" + END_LINE_TERM)
-                if component.reference.startswith('X') and "_SUBCKT" in component.attributes:
-                    # writing the sub-circuit if it was updated
-                    sub_circuit: AscEditor = component.attributes['_SUBCKT']
-                    if sub_circuit is not None and sub_circuit.updated:
-                        sub_circuit.save_netlist(sub_circuit.asc_file_path)
-                for attr, value in component.attributes.items():
-                    if not attr.startswith('_'):  # All these are not exported since they are only used internally
-                        asc.write(f"SYMATTR {attr} {value}" + END_LINE_TERM)
-            for directive in self.directives:
-                posX = directive.coord.X
-                posY = directive.coord.Y
-                alignment = asc_text_align_get(directive)
-                size = directive.size
-                if directive.type == TextTypeEnum.DIRECTIVE:
-                    directive_type = '!'
-                else:
-                    directive_type = ';'  # Otherwise assume it is a comment
-                asc.write(f"TEXT {posX} {posY} {alignment} {size} {directive_type}{directive.text}" + END_LINE_TERM)
-            for line in self.lines:
-                line_style = f' {line.style.pattern}' if line.style.pattern != "" else ""
-                asc.write(f"LINE Normal {line.V1.X} {line.V1.Y} {line.V2.X} {line.V2.Y}{line_style}" + END_LINE_TERM)
-            for shape in self.shapes:
-                line_style = f' {shape.line_style.pattern}' if shape.line_style.pattern != "" else ""
-                points = " ".join([f"{point.X} {point.Y}" for point in shape.points])
-                asc.write(f"{shape.name} Normal {points}{line_style}" + END_LINE_TERM)
+            asc.write(END_LINE_TERM.join(asc_lines))
 
     def reset_netlist(self, create_blank: bool = False) -> None:
         super().reset_netlist()
+        _logger.info(f"Parsing ASC file {self.asc_file_path}")
+        # Schematic files are small, so they are read and decoded at once and then split into lines.
+        # Note that the lines don't include the END_LINE_TERM. str.splitlines() isn't used, as it also splits on
+        # characters such as form feeds or unicode line separators, which can appear inside a TEXT.
         with open(self.asc_file_path, 'r', encoding=self.encoding) as asc_file:
-            _logger.info(f"Parsing ASC file {self.asc_file_path}")
-            component = None
-            for line in asc_file:
-                if line.startswith("SYMBOL"):
-                    tag, symbol, posX, posY, rotation = line.split()
-                    if component is not None:
-                        assert component.reference is not None, "Component InstName was not given"
-                        self.components[component.reference] = component
-                    component = SchematicComponent(self, line)
-                    component.symbol = symbol
-                    component.position.X = int(posX)
-                    component.position.Y = int(posY)
-                    if rotation in ASC_ROTATION_DICT:
-                        component.rotation = ASC_ROTATION_DICT[rotation]
-                    else:
-                        raise ValueError(f"Invalid Rotation value: {rotation}")
-                elif line.startswith("WINDOW"):
-                    assert component is not None, "Syntax Error: WINDOW clause without SYMBOL"
-                    tag, num_ref, posX, posY, alignment, size = line.split()
-                    component.append(line)
-                    coord = Point(int(posX), int(posY))
-                    text = Text(coord=coord, text=num_ref, size=size, type=TextTypeEnum.ATTRIBUTE)
-                    text = asc_text_align_set(text, alignment)
-                    component.attributes['_WINDOW ' + num_ref] = text
-
-                elif line.startswith("SYMATTR"):
-                    assert component is not None, "Syntax Error: SYMATTR clause without SYMBOL"
-                    component.append(line)
-                    tag, ref, text = line.split(maxsplit=2)
-                    text = text.strip()  # Gets rid of the \n terminator
-                    if ref == "InstName":
-                        component.reference = text
-                        symbol = self._get_symbol(component.symbol)
-                        if component.reference.startswith('X') or symbol.is_subcircuit():  # This is a subcircuit
-                            # then create the attribute "SUBCKT"
-                            component.attributes['_SUBCKT'] = self._get_subcircuit(symbol)
-                    else:
-                        # make sure prefix is uppercase, as this is used in a lot of places
-                        if ref.upper() == "PREFIX":
-                            text = text.upper()
-                        component.attributes[ref] = text
-                elif line.startswith("TEXT"):
-                    match = TEXT_REGEX.match(line)
-                    if match:
-                        text = match.group(TEXT_REGEX_TEXT)
-                        X = int(match.group(TEXT_REGEX_X))
-                        Y = int(match.group(TEXT_REGEX_Y))
-                        coord = Point(X, Y)
-                        size = int(match.group(TEXT_REGEX_SIZE))
-                        if match.group(TEXT_REGEX_TYPE) == "!":
-                            ttype = TextTypeEnum.DIRECTIVE
-                        else:
-                            ttype = TextTypeEnum.COMMENT
-                        alignment = match.group(TEXT_REGEX_ALIGN)
-                        text = Text(coord=coord, text=text.strip(), size=size, type=ttype)
-                        text = asc_text_align_set(text, alignment)
-                        self.directives.append(text)
-
-                elif line.startswith("WIRE"):
-                    tag, x1, y1, x2, y2 = line.split()
-                    v1 = Point(int(x1), int(y1))
-                    v2 = Point(int(x2), int(y2))
-                    wire = Line(v1, v2)
-                    self.wires.append(wire)
-                elif line.startswith("FLAG"):
-                    tag, posX, posY, text = line.split(maxsplit=4)
-                    coord = Point(int(posX), int(posY))
-                    flag = Text(coord=coord, text=text, type=TextTypeEnum.LABEL)
-                    self.labels.append(flag)
-                elif line.startswith("Version"):
-                    tag, version = line.split()
-                    assert version in ["4", "4.0", "4.1"], f"Unsupported version : {version}"
-                    self.version = version
-                elif line.startswith("SHEET "):
-                    self.sheet = line[len("SHEET "):].strip()
-                elif line.startswith("IOPIN "):
-                    tag, posX, posY, direction = line.split()
-                    text = self.labels[-1]  # Assuming it is the last FLAG parsed
-                    assert text.coord.X == int(posX) and text.coord.Y == int(posY), "Syntax Error, getting a IOPIN without an associated label"
-                    port = Port(text, direction)
-                    self.ports.append(port)
-                
-                # the following is identical to the code in asy_reader.py. If you modify it, do so in both places.
-                elif line.startswith("LINE") or line.startswith("RECTANGLE") or line.startswith("CIRCLE"):
-                    # format: LINE|RECTANGLE|CIRCLE Normal, x1, y1, x2, y2, [line_style]
-                    # Maybe support something else than 'Normal', but LTSpice does not seem to do so.
-                    line_elements = line.split()
-                    assert len(line_elements) in (6, 7), "Syntax Error, line badly badly formatted"
-                    x1 = int(line_elements[2])
-                    y1 = int(line_elements[3])
-                    x2 = int(line_elements[4])
-                    y2 = int(line_elements[5])
-                    if line.startswith("LINE"):
-                        line = Line(Point(x1, y1), Point(x2, y2))
-                        if len(line_elements) == 7:
-                            line.style.pattern = line_elements[6]
-                        self.lines.append(line)
-                    if line_elements[0] in ("RECTANGLE", "CIRCLE"):
-                        shape = Shape(line_elements[0], [Point(x1, y1), Point(x2, y2)])
-                        if len(line_elements) == 7:
-                            shape.line_style.pattern = line_elements[6]
-                        self.shapes.append(shape)
-
-                elif line.startswith("ARC"):
-                    # I don't support editing yet, so why make it complicated
-                    # format: ARC Normal, x1, y1, x2, y2, x3, y3, x4, y4 [line_style]
-                    # Maybe support something else than 'Normal', but LTSpice does not seem to do so.
-                    line_elements = line.split()
-                    assert len(line_elements) in (10, 11), "Syntax Error, line badly formatted"
-                    points = [Point(int(line_elements[i]), int(line_elements[i + 1])) for i in range(2, 9, 2)]
-                    arc = Shape("ARC", points)
-                    if len(line_elements) == 11:
-                        arc.line_style.pattern = line_elements[10]
-                    self.shapes.append(arc)
-                elif line.startswith("DATAFLAG"):
-                    pass  # DATAFLAG is the placeholder to show simulation information. It is ignored by AscEditor
-                else:
-                    raise NotImplementedError("Primitive not supported for ASC file\n" 
-                                              f'"{line}"')
-            if component is not None:
-                assert component.reference is not None, "Component InstName was not given"
-                self.components[component.reference] = component
+            asc_lines = asc_file.read().split(END_LINE_TERM)
+        if asc_lines[-1] == "":
+            asc_lines.pop()  # The file ends with a line terminator
+        component = None
+        get_parser = _ASC_LINE_PARSERS.get  # Bound once, as this is called for every line
+        for line in asc_lines:
+            # The first token identifies the primitive. It is split only once and then used to dispatch the
+            # line to the corresponding parser.
+            tag, _, rest = line.partition(' ')
+            parser = get_parser(tag)
+            if parser is None:
+                raise NotImplementedError("Primitive not supported for ASC file\n"
+                                          f'"{line}"')
+            component = parser(self, tag, rest, component)
+        if component is not None:
+            assert component.reference is not None, "Component InstName was not given"
+            self.components[component.reference] = component
+
+    # The following methods parse each of the primitives found on the ASC file. They all receive the primitive tag,
+    # the remainder of the line and the component being parsed, and return the component being parsed.
+
+    def _parse_symbol(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> SchematicComponent:
+        symbol, posX, posY, rotation = rest.split(None, 3)
+        if component is not None:
+            assert component.reference is not None, "Component InstName was not given"
+            self.components[component.reference] = component
+        component = SchematicComponent(self, f"{tag} {rest}{END_LINE_TERM}")
+        component.symbol = sys.intern(symbol)  # The same symbols and attribute names repeat throughout the file
+        component.position.X = int(posX)
+        component.position.Y = int(posY)
+        rotation = rotation.strip()
+        if rotation in ASC_ROTATION_DICT:
+            component.rotation = ASC_ROTATION_DICT[rotation]
+        else:
+            raise ValueError(f"Invalid Rotation value: {rotation}")
+        return component
+
+    def _parse_window(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> SchematicComponent:
+        assert component is not None, "Syntax Error: WINDOW clause without SYMBOL"
+        num_ref, posX, posY, alignment, size = rest.split()
+        component.append(f"{tag} {rest}{END_LINE_TERM}")
+        coord = Point(int(posX), int(posY))
+        text = Text(coord=coord, text=num_ref, size=size, type=TextTypeEnum.ATTRIBUTE)
+        text = asc_text_align_set(text, alignment)
+        component.attributes[sys.intern('_WINDOW ' + num_ref)] = text
+        return component
+
+    def _parse_symattr(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> SchematicComponent:
+        assert component is not None, "Syntax Error: SYMATTR clause without SYMBOL"
+        component.append(f"{tag} {rest}{END_LINE_TERM}")
+        ref, text = rest.split(None, 1)
+        ref = sys.intern(ref)
+        text = text.strip()
+        if ref == "InstName":
+            component.reference = text
+            symbol = self._get_symbol(component.symbol)
+            if component.reference.startswith('X') or symbol.is_subcircuit():  # This is a subcircuit
+                # then create the attribute "SUBCKT"
+                component.attributes['_SUBCKT'] = self._get_subcircuit(symbol)
+        else:
+            # make sure prefix is uppercase, as this is used in a lot of places
+            if ref.upper() == "PREFIX":
+                text = text.upper()
+            component.attributes[ref] = text
+        return component
+
+    def _parse_text(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        # format: TEXT x y alignment size <type><text>, where <type> is '!' for directives and ';' for comments.
+        # Texts that don't follow this format are ignored.
+        fields = rest.split(None, 3)
+        if len(fields) != 4:
+            return component
+        posX, posY, alignment, size_and_text = fields
+        if (alignment[1:] if alignment.startswith('V') else alignment) not in ASC_TEXT_ALIGNMENTS:
+            return component
+        # The text type may follow the size without any space in between, as in "2!.op"
+        text = size_and_text.lstrip("0123456789")
+        size = size_and_text[:len(size_and_text) - len(text)]
+        text = text.lstrip()
+        if not size or not text:
+            return component
+        text_type = text[0]
+        if text_type == "!":
+            ttype = TextTypeEnum.DIRECTIVE
+        elif text_type == ";":
+            ttype = TextTypeEnum.COMMENT
+        else:
+            return component  # Not a directive nor a comment. It is ignored
+        coord = Point(int(posX), int(posY))
+        text = Text(coord=coord, text=text[1:].strip(), size=int(size), type=ttype)
+        text = asc_text_align_set(text, alignment)
+        self.directives.append(text)
+        return component
+
+    def _parse_wire(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        # Wires are by far the most frequent primitive, so this is kept as lean as possible
+        x1, y1, x2, y2 = rest.split()
+        self.wires.append(Line(Point(int(x1), int(y1)), Point(int(x2), int(y2))))
+        return component
+
+    def _parse_flag(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        posX, posY, text = rest.split()
+        coord = Point(int(posX), int(posY))
+        flag = Text(coord=coord, text=text, type=TextTypeEnum.LABEL)
+        self.labels.append(flag)
+        return component
+
+    def _parse_version(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        version = rest.strip()
+        assert version in ["4", "4.0", "4.1"], f"Unsupported version : {version}"
+        self.version = version
+        return component
+
+    def _parse_sheet(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        sheet_no, width, height = rest.split()
+        self.sheet = (int(sheet_no), int(width), int(height))
+        return component
+
+    def _parse_iopin(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        posX, posY, direction = rest.split()
+        text = self.labels[-1]  # Assuming it is the last FLAG parsed
+        assert text.coord.X == int(posX) and text.coord.Y == int(posY), "Syntax Error, getting a IOPIN without an associated label"
+        port = Port(text, direction)
+        self.ports.append(port)
+        return component
+
+    def _parse_line_or_shape(self, tag: str, rest: str,
+                             component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        # the following is identical to the code in asy_reader.py. If you modify it, do so in both places.
+        # format: LINE|RECTANGLE|CIRCLE Normal, x1, y1, x2, y2, [line_style]
+        # Maybe support something else than 'Normal', but LTSpice does not seem to do so.
+        line_elements = rest.split()
+        assert len(line_elements) in (5, 6), "Syntax Error, line badly badly formatted"
+        x1 = int(line_elements[1])
+        y1 = int(line_elements[2])
+        x2 = int(line_elements[3])
+        y2 = int(line_elements[4])
+        if tag == "LINE":
+            line = Line(Point(x1, y1), Point(x2, y2))
+            if len(line_elements) == 6:
+                line.style.pattern = line_elements[5]
+            self.lines.append(line)
+        else:  # RECTANGLE or CIRCLE
+            shape = Shape(tag, [Point(x1, y1), Point(x2, y2)])
+            if len(line_elements) == 6:
+                shape.line_style.pattern = line_elements[5]
+            self.shapes.append(shape)
+        return component
+
+    def _parse_arc(self, tag: str, rest: str, component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        # I don't support editing yet, so why make it complicated
+        # format: ARC Normal, x1, y1, x2, y2, x3, y3, x4, y4 [line_style]
+        # Maybe support something else than 'Normal', but LTSpice does not seem to do so.
+        line_elements = rest.split()
+        assert len(line_elements) in (9, 10), "Syntax Error, line badly formatted"
+        points = [Point(int(line_elements[i]), int(line_elements[i + 1])) for i in range(1, 8, 2)]
+        arc = Shape("ARC", points)
+        if len(line_elements) == 10:
+            arc.line_style.pattern = line_elements[9]
+        self.shapes.append(arc)
+        return component
+
+    def _parse_dataflag(self, tag: str, rest: str,
+                        component: Optional[SchematicComponent]) -> Optional[SchematicComponent]:
+        return component  # DATAFLAG is the placeholder to show simulation information. It is ignored by AscEditor
 
     def _get_symbol(self, symbol: str) -> AsyReader:
         asy_filename = symbol + os.path.extsep + "asy"
@@ -322,15 +376,24 @@ class AscEditor(BaseSchematic):
         component.position = position
         component.rotation = rotation
 
+    def _get_directives(self, *commands: str) -> Iterator[Text]:
+        """
+        Yields, in file order, the texts whose first word is one of the given commands. The commands must be given
+        in upper case.
+        The directives are scanned on every call, as both the directives list and the texts may be edited directly.
+        """
+        for directive in self.directives:
+            tokens = directive.text.split(maxsplit=1)
+            if tokens and tokens[0].upper() in commands:
+                yield directive
+
     def _get_param_named(self, param_name):
         param_name_uppercase = param_name.upper()
-        search_expression = re.compile(PARAM_REGEX(r"\w+"), re.IGNORECASE)
-        for directive in self.directives:
-            if directive.text.upper().startswith(".PARAM"):
-                matches = search_expression.finditer(directive.text)
-                for match in matches:
-                    if match.group("name").upper() == param_name_uppercase:
-                        return match, directive
+        for directive in self._get_directives(".PARAM", ".PARAMS"):
+            matches = param_regex.finditer(directive.text)
+            for match in matches:
+                if match.group("name").upper() == param_name_uppercase:
+                    return match, directive
         return None, None
 
     def get_parameter(self, param: str) -> str:
@@ -349,7 +412,7 @@ class AscEditor(BaseSchematic):
         if match:
             _logger.debug(f"Parameter {param} found in ASC file, updating it")
             start, stop = match.span('value')
-            directive.text = f"{directive.text[:start]}{value_str}{directive.text[stop:]}"
+            directive.text = directive.text[:start] + value_str + directive.text[stop:]
             _logger.info(f"Parameter {param} updated to {value_str}")
         else:
             # Was not found so we need to add it,
@@ -362,6 +425,37 @@ class AscEditor(BaseSchematic):
             self.directives.append(directive)
         self.updated = True
 
+    def set_parameters(self, **kwargs):
+        # docstring inherited from BaseEditor
+        # All the parameters are searched first, so that all the updates done on the same directive are applied in
+        # a single pass. Parameters not found are then added one by one by set_parameter().
+        edits = {}  # id(directive) -> (directive, {start: (stop, value_str)})
+        missing = {}
+        for param, value in kwargs.items():
+            match, directive = self._get_param_named(param)
+            if match is None:
+                missing[param] = value
+                continue
+            value_str = format_eng(value) if isinstance(value, (int, float)) else value
+            start, stop = match.span('value')
+            edits.setdefault(id(directive), (directive, {}))[1][start] = (stop, value_str)
+            _logger.info(f"Parameter {param} updated to {value_str}")
+        for directive, spans in edits.values():
+            text = directive.text
+            chunks = []
+            # The edits are done from right to left so that the spans still to be applied remain valid
+            for start in sorted(spans, reverse=True):
+                stop, value_str = spans[start]
+                chunks.append(text[stop:])
+                chunks.append(value_str)
+                text = text[:start]
+            chunks.append(text)
+            directive.text = "".join(reversed(chunks))
+        if edits:
+            self.updated = True
+        for param, value in missing.items():
+            self.set_parameter(param, value)
+
     def set_component_value(self, device: str, value: Union[str, int, float]) -> None:
         """
         Sets the value of the component
@@ -424,7 +518,6 @@ class AscEditor(BaseSchematic):
         """
         component = self.get_component(element)
         parameters = {}
-        search_regex = re.compile(PARAM_REGEX(r'\w+'), re.IGNORECASE)
         for key, value in component.attributes.items():
             if key in LTSPICE_PARAMETERS:
                 parameters[key] = value
@@ -432,7 +525,7 @@ class AscEditor(BaseSchematic):
                     # if we have a structured attribute, return the full dict of it
                     # this is compatible with set_component_parameters
                     sub_parameters = {}                    
-                    matches = search_regex.finditer(value)
+                    matches = param_regex.finditer(value)
                     # This might contain one or more parameters
                     for match in matches:
                         sub_parameters[match.group("name")] = try_convert_value(match.group("value"))
@@ -526,7 +619,8 @@ class AscEditor(BaseSchematic):
     def get_components(self, prefixes='*') -> list:
         if prefixes == '*':
             return list(self.components.keys())
-        return [k for k in self.components.keys() if k[0] in prefixes]
+        prefixes = frozenset(prefixes)
+        return [k for k in self.components.keys() if k and k[0] in prefixes]
 
     def remove_component(self, designator: str):
         sub_circuit, ref = self._get_parent(designator)
@@ -537,33 +631,17 @@ class AscEditor(BaseSchematic):
         """
         Returns the coordinate on the Schematic File canvas where a text can be appended.
         """
-        min_x = 100000  # High enough to be sure it will be replaced
-        max_x = -100000
-        min_y = 100000  # High enough to be sure it will be replaced
-        max_y = -100000
-        _, x, y = self.sheet.split()
-        min_x = min(min_x, int(x))
-        min_y = min(min_y, int(y))
-        for wire in self.wires:
-            min_x = min(min_x, wire.V1.X, wire.V2.X)
-            max_x = max(max_x, wire.V1.X, wire.V2.X)
-            min_y = min(min_y, wire.V1.Y, wire.V2.Y)
-            max_y = max(max_y, wire.V1.Y, wire.V2.Y)
-        for flag in self.labels:
-            min_x = min(min_x, flag.coord.X)
-            max_x = max(max_x, flag.coord.X)
-            min_y = min(min_y, flag.coord.Y)
-            max_y = max(max_y, flag.coord.Y)
-        for directive in self.directives:
-            min_x = min(min_x, directive.coord.X)
-            max_x = max(max_x, directive.coord.X)
-            min_y = min(min_y, directive.coord.Y)
-            max_y = max(max_y, directive.coord.Y)
-        for component in self.components.values():
-            min_x = min(min_x, component.position.X)
-            max_x = max(max_x, component.position.X)
-            min_y = min(min_y, component.position.Y)
-            max_y = max(max_y, component.position.Y)
+        # Only the leftmost and the bottommost coordinates are needed to place the text
+        points = [
+            *(wire.V1 for wire in self.wires),
+            *(wire.V2 for wire in self.wires),
+            *(flag.coord for flag in self.labels),
+            *(directive.coord for directive in self.directives),
+            *(component.position for component in self.components.values()),
+        ]
+        _, x, y = self.sheet
+        min_x = min(x, min((point.X for point in points), default=100000))
+        max_y = max((point.Y for point in points), default=-100000)
 
         return min_x, max_y + 24  # Setting the text in the bottom left corner of the canvas
 
@@ -611,18 +689,12 @@ class AscEditor(BaseSchematic):
 
         if set_command in UNIQUE_SIMULATION_DOT_INSTRUCTIONS:
             # Before adding new instruction, if it is a unique instruction, we just replace it
-            i = 0
-            while i < len(self.directives):
-                directive = self.directives[i]
+            for directive in self._get_directives(*UNIQUE_SIMULATION_DOT_INSTRUCTIONS):
                 if directive.type == TextTypeEnum.COMMENT:
-                    i += 1
                     continue  # this is a comment
-                directive_command = directive.text.split()[0].upper()
-                if directive_command in UNIQUE_SIMULATION_DOT_INSTRUCTIONS:
-                    directive.text = instruction
-                    self.updated = True
-                    return  # Job done, can exit this method
-                i += 1
+                directive.text = instruction
+                self.updated = True
+                return  # Job done, can exit this method
         elif set_command.startswith('.PARAM'):
             raise RuntimeError('The .PARAM instruction should be added using the "set_parameter" method')
         # If we get here, then the instruction was not found, so we need to add it
@@ -649,18 +721,36 @@ class AscEditor(BaseSchematic):
 
     def remove_Xinstruction(self, search_pattern: str) -> None:
         regex = re.compile(search_pattern, re.IGNORECASE)
-        instr_removed = False
-        i = 0
-        while i < len(self.directives):
-            instruction = self.directives[i].text
-            if regex.match(instruction) is not None:
-                instr_removed = True
-                del self.directives[i]
-                _logger.info(f"Instruction {instruction} removed")
+        # The directives to keep are collected in a single pass, instead of deleting them one by one from the list
+        directives_kept = []
+        for directive in self.directives:
+            if regex.match(directive.text) is not None:
+                _logger.info(f"Instruction {directive.text} removed")
             else:
-                i += 1
+                directives_kept.append(directive)
+        instr_removed = len(directives_kept) != len(self.directives)
+        self.directives[:] = directives_kept
         if instr_removed:
             self.updated = True
         else:
             msg = f'Instructions matching "{search_pattern}" not found'
             _logger.error(msg)
+
+
+_ASC_LINE_PARSERS = {
+    "SYMBOL": AscEditor._parse_symbol,
+    "WINDOW": AscEditor._parse_window,
+    "SYMATTR": AscEditor._parse_symattr,
+    "TEXT": AscEditor._parse_text,
+    "WIRE": AscEditor._parse_wire,
+    "FLAG": AscEditor._parse_flag,
+    "Version": AscEditor._parse_version,
+    "SHEET": AscEditor._parse_sheet,
+    "IOPIN": AscEditor._parse_iopin,
+    "LINE": AscEditor._parse_line_or_shape,
+    "RECTANGLE": AscEditor._parse_line_or_shape,
+    "CIRCLE": AscEditor._parse_line_or_shape,
+    "ARC": AscEditor._parse_arc,
+    "DATAFLAG": AscEditor._parse_dataflag,
+}
+"""Maps the first token of each ASC line to the method that parses it"""
@@ -258,6 +258,7 @@ class Primitive(object):
     """Holds the information of a primitive element in the netlist. This is a base class for the Component and is
     used to hold the information of the netlist primitives, such as .PARAM, .OPTIONS, .IC, .NODESET, .GLOBAL, etc.
     """
+    __slots__ = ("line",)
 
     def __init__(self, line: str):
         self.line = line
@@ -272,6 +273,7 @@ class Primitive(object):
 
 class Component(Primitive):
     """Holds component information"""
+    __slots__ = ("reference", "attributes", "ports", "parent")
 
     def __init__(self, parent, line: str):
         super().__init__(line)
@@ -136,6 +136,8 @@ class TextTypeEnum(enum.IntEnum):
 
 class LineStyle:
     """Line style : width, color and pattern (dashed, dotted, etc...) """
+    __slots__ = ("width", "color", "pattern")
+
     def __init__(self, width: str = "", color: str = "", pattern: str = ""):
         self.width: str = width
         self.color: str = color
@@ -144,6 +146,8 @@ class LineStyle:
 
 class Point:
     """X, Y coordinates"""
+    __slots__ = ("X", "Y")
+
     def __init__(self, X: float, Y: float):
         self.X = X
         self.Y = Y
@@ -151,6 +155,8 @@ class Point:
 
 class Line:
     """X1, Y1, X2, Y2 coordinates"""
+    __slots__ = ("V1", "V2", "style", "net")
+
     def __init__(self, v1: Point, v2: Point, style: LineStyle = None, net: str = ""):
         self.V1 = v1
         self.V2 = v2
@@ -237,7 +243,7 @@ class Shape:
 #     # The Arcs are decorative, they don't have associated nets
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Text:
     """Text object"""
     coord: Point
@@ -258,6 +264,7 @@ class Port:
 
 class SchematicComponent(Component):
     """Holds component information"""
+    __slots__ = ("position", "rotation", "symbol")
 
     def __init__(self, parent, line):
         super().__init__(parent, line)
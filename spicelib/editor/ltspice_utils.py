@@ -18,7 +18,7 @@
 #
 # -------------------------------------------------------------------------------
 
-import re
+from typing import Union
 
 from .base_schematic import ERotation, Text, HorAlign, VerAlign
 
@@ -26,18 +26,6 @@ __author__ = "Nuno Canto Brum <nuno.brum@gmail.com>"
 __copyright__ = "Copyright 2024, Fribourg Switzerland"
 
 
-# Regular expressions
-TEXT_REGEX = re.compile(
-    r"TEXT (-?\d+)\s+(-?\d+)\s+V?(Left|Right|Top|Bottom|Center|Invisible)\s(\d+)\s*(?P<type>[!;])(?P<text>.*)",
-    re.IGNORECASE
-)
-
-TEXT_REGEX_X = 1
-TEXT_REGEX_Y = 2
-TEXT_REGEX_ALIGN = 3
-TEXT_REGEX_SIZE = 4
-TEXT_REGEX_TYPE = 5
-TEXT_REGEX_TEXT = 6
 END_LINE_TERM = "\n"
 ASC_ROTATION_DICT = {
     'R0': ERotation.R0,
@@ -49,7 +37,11 @@ ASC_ROTATION_DICT = {
     'M180': ERotation.M180,
     'M270': ERotation.M270,
 }
-ASC_INV_ROTATION_DICT = {val: key for key, val in ASC_ROTATION_DICT.items()}
+# Rotation names indexed by the ERotation value divided by 45. LTspice doesn't support the 45 degree rotations.
+ASC_INV_ROTATION = (
+    'R0', None, 'R90', None, 'R180', None, 'R270', None,
+    'M0', None, 'M90', None, 'M180', None, 'M270', None,
+)
 LT_ATTRIBUTE_NUMBERS = {
     'Prefix': 0,
     'Type': 1,
@@ -66,30 +58,47 @@ LT_ATTRIBUTE_NUMBERS_INV = {val: key for key, val in LT_ATTRIBUTE_NUMBERS.items(
 WEIGHT_CONVERSION_TABLE = ('Thin', 'Normal', 'Thick')
 
 
+# Alignment names used on ASC files and the corresponding horizontal and vertical alignments
+ASC_TEXT_ALIGNMENTS = {
+    'Left': (HorAlign.LEFT, VerAlign.CENTER),
+    'Center': (HorAlign.CENTER, VerAlign.CENTER),
+    'Right': (HorAlign.RIGHT, VerAlign.CENTER),
+    'Top': (HorAlign.CENTER, VerAlign.TOP),
+    'Bottom': (HorAlign.CENTER, VerAlign.BOTTOM),
+    'Invisible': (HorAlign.CENTER, VerAlign.CENTER),
+}
+# Inverse lookups. The horizontal alignment is only written when the text is vertically centered.
+ASC_TEXT_HOR_ALIGNMENTS_INV = {
+    HorAlign.LEFT: 'Left',
+    HorAlign.CENTER: 'Center',
+    HorAlign.RIGHT: 'Right',
+}
+ASC_TEXT_VER_ALIGNMENTS_INV = {
+    VerAlign.TOP: 'Top',
+    VerAlign.BOTTOM: 'Bottom',
+}
+
+
+def asc_rotation_name(rotation: Union[ERotation, int, float]) -> str:
+    """Returns the name of the rotation in the ASC format. Raises a ValueError if LTspice doesn't support it."""
+    index, remainder = divmod(rotation, 45)
+    if remainder == 0 and 0 <= index < len(ASC_INV_ROTATION):
+        name = ASC_INV_ROTATION[int(index)]
+        if name is not None:
+            return name
+    raise ValueError(f"Rotation {rotation} not supported on ASC files")
+
+
 def asc_text_align_set(text: Text, alignment: str):
     """Sets the alignment of the text in the ASC format"""
-    # Default
-    text.textAlignment = HorAlign.CENTER
-    text.verticalAlignment = VerAlign.CENTER
-    if alignment == 'Left' or alignment == 'VLeft':
-        text.textAlignment = HorAlign.LEFT
-    elif alignment == 'Center' or alignment == 'VCenter':
-        pass
-    elif alignment == 'Right' or alignment == 'VRight':
-        text.textAlignment = HorAlign.RIGHT
-    elif alignment == 'Top' or alignment == 'VTop':
-        text.verticalAlignment = VerAlign.TOP
-    elif alignment == 'Bottom' or alignment == 'VBottom':
-        text.verticalAlignment = VerAlign.BOTTOM
-    elif alignment == 'Invisible' or alignment == 'VInvisible':
-        text.visible = False
-    else:
+    vertical_text = alignment.startswith('V')
+    alignment_name = alignment[1:] if vertical_text else alignment
+    if alignment_name not in ASC_TEXT_ALIGNMENTS:
         raise ValueError(f"Invalid alignment {alignment}")
-
-    if alignment.startswith('V'):
-        text.angle = ERotation.R90
-    else:
-        text.angle = ERotation.R0
+    text.textAlignment, text.verticalAlignment = ASC_TEXT_ALIGNMENTS[alignment_name]
+    if alignment_name == 'Invisible':
+        text.visible = False
+    text.angle = ERotation.R90 if vertical_text else ERotation.R0
     return text
 
 
@@ -97,21 +106,10 @@ def asc_text_align_get(text: Text) -> str:
     """Returns the alignment of the text in the ASC format"""
     if not text.visible:
         ans = 'Invisible'
+    elif text.verticalAlignment == VerAlign.CENTER:
+        ans = ASC_TEXT_HOR_ALIGNMENTS_INV.get(text.textAlignment, 'Left')
     else:
-        if text.verticalAlignment == VerAlign.CENTER:
-            if text.textAlignment == HorAlign.RIGHT:
-                ans = 'Right'
-            elif text.textAlignment == HorAlign.CENTER:
-                ans = 'Center'
-            else:
-                ans = 'Left'
-        else:
-            if text.verticalAlignment == VerAlign.TOP:
-                ans = 'Top'
-            elif text.verticalAlignment == VerAlign.BOTTOM:
-                ans = 'Bottom'
-            else:            
-                ans = 'Left'
+        ans = ASC_TEXT_VER_ALIGNMENTS_INV.get(text.verticalAlignment, 'Left')
 
     if text.angle == ERotation.R90:
         ans = 'V' + ans
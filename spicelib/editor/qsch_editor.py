@@ -336,6 +336,20 @@ class QschTag:
             return a
 
 
+class _QspiceLibraryPaths:
+    """Class attribute holding the QSPICE library paths. They are only looked up when first read, so that importing
+    spicelib doesn't search for QSPICE. The value then replaces this descriptor on the class."""
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance, owner=None) -> List[str]:
+        paths = Qspice.get_default_library_paths()
+        setattr(self.owner, self.name, paths)
+        return paths
+
+
 class QschEditor(BaseSchematic):
     """Class made to update directly QSCH files. It is a subclass of BaseSchematic, so it can be used to
     update the netlist and the parameters of the simulation. It can also be used to update the components.
@@ -345,7 +359,7 @@ class QschEditor(BaseSchematic):
     :keyword create_blank: If True, the file will be created from scratch. If False, the file will be read and parsed
     """
 
-    simulator_lib_paths: List[str] = Qspice.get_default_library_paths()    
+    simulator_lib_paths: List[str] = _QspiceLibraryPaths()
     """ This is initialised with typical locations found for QSPICE.
     You can (and should, if you use wine), call `prepare_for_simulator()` once you've set the executable paths.
     This is a class variable, so it will be shared between all instances.
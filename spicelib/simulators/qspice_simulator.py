@@ -22,7 +22,7 @@ import sys
 import os
 
 from pathlib import Path
-from typing import Union
+from typing import Union, List
 import logging
 from ..sim.simulator import Simulator, run_function, SpiceSimulatorError
 import subprocess
@@ -52,32 +52,10 @@ class Qspice(Simulator):
     _default_lib_paths = ["C:/Program Files/QSPICE",
                           "~/Documents/QSPICE"]
 
-    """Searches on the any usual locations for a simulator"""
-    # defaults:
+    # defaults. The executable is only searched when first needed. See _locate().
     spice_exe = []
-    process_name = None  
-        
-    if sys.platform == "linux" or sys.platform == "darwin":
-        # status mid 2024: Qspice has limited support for running under linux+wine, and none for MacOS+wine
-        # TODO: when the situation gets more mature, add support for wine. See LTspice for an example.
-        spice_exe = []
-        process_name = None
-    else:  # Windows (well, also aix, wasi, emscripten,... where it will fail.)
-        for exe in _spice_exe_win_paths:
-            if exe.startswith("~"):
-                # expand here, as I use _spice_exe_win_paths also for linux, and expanding earlier will fail
-                exe = os.path.expanduser(exe)
-            if os.path.exists(exe):
-                spice_exe = [exe]
-                break        
-
-    # fall through        
-    if len(spice_exe) == 0:
-        spice_exe = []
-        process_name = None
-    else:
-        process_name = Simulator.guess_process_name(spice_exe[0])        
-        _logger.debug(f"Found Qspice installed in: '{spice_exe}' ")
+    process_name = None
+    _exe_searched = False
 
     qspice_args = {
         'ASCII'     : ['-ASCII'],  # Use ASCII file format for the output data(.qraw) file.
@@ -92,6 +70,52 @@ class Qspice(Simulator):
     }
     """:meta private:"""
 
+    # The qspice_args above, split into the fixed part of the switch and whether the path is to be appended.
+    _qspice_switches = {
+        switch: (tuple(args[:-1]), True) if args[-1] == '<path>' else (tuple(args), False)
+        for switch, args in qspice_args.items()
+    }
+
+    @classmethod
+    def _locate(cls) -> None:
+        """Searches the usual locations for the simulator executable. This is only done once, and only if the
+        executable wasn't already set, for example by create_from().
+
+        :meta private:
+        """
+        if cls._exe_searched:
+            return
+        cls._exe_searched = True
+        if cls.spice_exe:
+            return
+
+        if sys.platform == "linux" or sys.platform == "darwin":
+            # status mid 2024: Qspice has limited support for running under linux+wine, and none for MacOS+wine
+            # TODO: when the situation gets more mature, add support for wine. See LTspice for an example.
+            return
+        # Windows (well, also aix, wasi, emscripten,... where it will fail.)
+        for exe in cls._spice_exe_win_paths:
+            if exe.startswith("~"):
+                # expand here, as I use _spice_exe_win_paths also for linux, and expanding earlier will fail
+                exe = os.path.expanduser(exe)
+            if os.path.exists(exe):
+                cls.spice_exe = [exe]
+                cls.process_name = Simulator.guess_process_name(exe)
+                _logger.debug(f"Found Qspice installed in: '{cls.spice_exe}' ")
+                break
+
+    @classmethod
+    def is_available(cls):
+        # docstring inherited from Simulator
+        cls._locate()
+        return super().is_available()
+
+    @classmethod
+    def get_default_library_paths(cls) -> List[str]:
+        # docstring inherited from Simulator
+        cls._locate()
+        return super().get_default_library_paths()
+
     @classmethod
     def valid_switch(cls, switch, path='') -> list:
         """
@@ -119,10 +143,9 @@ class Qspice(Simulator):
         :type path: str, optional
         :return: Nothing
         """
-        if switch in cls.qspice_args:
-            switches = cls.qspice_args[switch]
-            switches = [switch.replace('<path>', path) for switch in switches]
-            return switches
+        if switch in cls._qspice_switches:
+            switches, needs_path = cls._qspice_switches[switch]
+            return [*switches, path] if needs_path else list(switches)
         else:
             raise ValueError("Invalid switch for class ")
 
@@ -152,6 +175,7 @@ class Qspice(Simulator):
         :return: return code from the process
         :rtype: int
         """
+        cls._locate()
         if not cls.spice_exe:
             _logger.error("================== ALERT! ====================")
             _logger.error("Unable to find the QSPICE executable.")
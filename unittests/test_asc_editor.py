@@ -26,6 +26,7 @@ sys.path.append(
     os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../")))  # add project root to lib search path
 
 import spicelib
+from spicelib.editor.base_schematic import Text, Point, TextTypeEnum
 # import logging
 
 test_dir = '../examples/testfiles/' if os.path.abspath(os.curdir).endswith('unittests') else './examples/testfiles/'
@@ -77,6 +78,50 @@ class ASC_Editor_Test(unittest.TestCase):
         self.edt.save_netlist(temp_dir + 'test_components_output_1.asc')
         self.equalFiles(temp_dir + 'test_components_output_1.asc', golden_dir + 'test_components_output_1.asc')
 
+    def test_unsupported_rotation(self):
+        r1 = self.edt.get_component('R1')
+        for rotation in (10, 45, 100, -90, 720):
+            r1.rotation = rotation
+            with self.assertRaises(ValueError, msg=f"Tested rotation {rotation}"):
+                self.edt.save_netlist(temp_dir + 'test_rotation_output.asc')
+        r1.rotation = 90.0
+        self.edt.save_netlist(temp_dir + 'test_rotation_output.asc')
+        with open(temp_dir + 'test_rotation_output.asc', 'r') as asc_file:
+            self.assertIn("SYMBOL res 272 112 R90\n", asc_file.readlines(), "Tested float rotation")
+
+    def test_text_round_trip(self):
+        asc_lines = [
+            "Version 4",
+            "SHEET 1 880 680",
+            "TEXT 56 488 VLeft 2 !.tran 1m",
+            "TEXT 56 440 Right 2 ;some comment",
+            "TEXT 56 400 Left 2 not a directive nor a comment",
+            "TEXT 56 360 Diagonal 2 !.op",
+            "TEXT 56 320 Left 2!.step param res 1k 2k 1k",
+        ]
+        with open(temp_dir + 'text_round_trip.asc', 'w') as asc_file:
+            asc_file.write("\n".join(asc_lines) + "\n")
+        edt = spicelib.editor.asc_editor.AscEditor(temp_dir + 'text_round_trip.asc')
+        self.assertEqual(['.tran 1m', 'some comment', '.step param res 1k 2k 1k'],
+                         [text.text for text in edt.directives], "Tested TEXT types")
+        edt.save_netlist(temp_dir + 'text_round_trip_output.asc')
+        with open(temp_dir + 'text_round_trip_output.asc', 'r') as asc_file:
+            self.assertListEqual(asc_lines[:4] + ["TEXT 56 320 Left 2 !.step param res 1k 2k 1k"],
+                                 asc_file.read().splitlines(), "Tested TEXT round trip")
+
+    def test_text_with_line_separators(self):
+        # Only the END_LINE_TERM separates lines. Other characters that str.splitlines() would split on are kept
+        asc_lines = [
+            "Version 4",
+            "SHEET 1 880 680",
+            "TEXT 10 20 Left 2 ;a\x0cb",
+            "TEXT 10 60 Left 2 ;c\u2028d",
+        ]
+        with open(temp_dir + 'text_line_separators.asc', 'w', encoding='utf-8') as asc_file:
+            asc_file.write("\n".join(asc_lines) + "\n")
+        edt = spicelib.editor.asc_editor.AscEditor(temp_dir + 'text_line_separators.asc')
+        self.assertEqual(['a\x0cb', 'c\u2028d'], [text.text for text in edt.directives], "Tested TEXT separators")
+
     def test_parameter_edit(self):
         self.assertEqual(self.edt.get_parameter('TEMP'), '0', "Tested TEMP Parameter")  # add assertion here
         self.edt.set_parameter('TEMP', 25)
@@ -91,6 +136,40 @@ class ASC_Editor_Test(unittest.TestCase):
         self.edt.set_parameters(ton="{sin(0.22)}", toff="{10p + 50p}")
         self.assertEqual("{sin(0.22)}", self.edt.get_parameter("ton"), "ton test 2")
 
+    def test_parameters_on_same_directive(self):
+        directive = next(d for d in self.edt.directives if d.text.startswith('.param res'))
+        directive.text = ".param xres=1k res=10k cap = 1n ind={2*lval}"
+        self.assertEqual("10k", self.edt.get_parameter("RES"), "Tested parameter with a name contained in another")
+        self.assertEqual("1n", self.edt.get_parameter("cap"), "Tested parameter with spaces around =")
+        self.edt.set_parameters(ind="10u", res=4.7e3, cap="{cval}", new_param=1)
+        self.assertEqual(".param xres=1k res=4.7k cap = {cval} ind=10u", directive.text, "Tested parameters on the same directive")
+        self.assertEqual("1", self.edt.get_parameter("new_param"), "Tested added parameter")
+
+    def test_parameter_used_in_expression(self):
+        directive = next(d for d in self.edt.directives if d.text.startswith('.param res'))
+        directive.text = ".param total={r1 + r2} r1=1k r2=2k"
+        self.assertEqual("1k", self.edt.get_parameter("r1"), "Tested parameter also used in an expression")
+        self.assertEqual("{r1 + r2}", self.edt.get_parameter("total"), "Tested parameter with an expression")
+        directive.text = ".param x={a + b} a=1"
+        self.edt.set_parameter("a", 2)
+        self.assertEqual(".param x={a + b} a=2", directive.text, "Tested setting a parameter used in an expression")
+
+    def test_directives_edited_directly(self):
+        self.assertEqual("10k", self.edt.get_parameter("res"), "Tested parameter")
+        self.edt.directives.append(Text(coord=Point(56, 536), text=".param z=3", size=2, type=TextTypeEnum.DIRECTIVE))
+        self.assertEqual("3", self.edt.get_parameter("z"), "Tested parameter on an appended directive")
+        op = next(d for d in self.edt.directives if d.text == ".op")
+        op.text = ".param w=4"
+        self.assertEqual("4", self.edt.get_parameter("w"), "Tested parameter on an edited directive")
+
+    def test_unique_instruction_replaced_in_file_order(self):
+        self.edt.directives.append(Text(coord=Point(56, 536), text=".ac dec 10 1 1k", size=2, type=TextTypeEnum.DIRECTIVE))
+        self.edt.add_instruction(".tran 1m")
+        texts = [directive.text for directive in self.edt.directives]
+        self.assertIn(".tran 1m", texts, "Tested added instruction")
+        self.assertNotIn(".dc Vin 1 10 9", texts, "Tested first unique instruction is replaced")
+        self.assertIn(".ac dec 10 1 1k", texts, "Tested later unique instruction is kept")
+
     def test_instructions(self):
         self.edt.add_instruction('.ac dec 10 1 100k')
         self.edt.add_instruction('.save V(vout)')